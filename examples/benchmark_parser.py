@@ -0,0 +1,94 @@
+"""
+Episode Extraction Microbenchmark for PodCrawlerMCP.
+
+This example compares the single-pass episode extractor with the previous
+per-field XPath lookups on a synthetic feed.
+"""
+import timeit
+import xml.etree.ElementTree as ET
+
+from podcrawler.crawler.parser import (
+    ITUNES_NS,
+    PODCAST_NS,
+    _extract_episode,
+    _get_element_text,
+    _parse_date,
+)
+
+
+ITEM_TEMPLATE = """
+    <item>
+      <title>Episode {n}</title>
+      <description>Discussion number {n} about science and technology.</description>
+      <link>https://example.com/episodes/{n}</link>
+      <guid>episode-{n}</guid>
+      <pubDate>Mon, 02 Jan 2023 10:00:00 +0000</pubDate>
+      <enclosure url="https://example.com/audio/{n}.mp3" type="audio/mpeg" length="1234"/>
+      <itunes:duration>00:42:00</itunes:duration>
+      <itunes:explicit>no</itunes:explicit>
+      <itunes:episodeType>full</itunes:episodeType>
+      <podcast:transcript url="https://example.com/transcripts/{n}.vtt" type="text/vtt"/>
+      <podcast:chapters url="https://example.com/chapters/{n}.json" type="application/json+chapters"/>
+    </item>"""
+
+
+def build_feed(num_items: int) -> ET.Element:
+    """Build a synthetic RSS channel with the given number of items."""
+    items = "".join(ITEM_TEMPLATE.format(n=n) for n in range(num_items))
+    xml = (
+        f'<rss xmlns:itunes="{ITUNES_NS}" xmlns:podcast="{PODCAST_NS}">'
+        f"<channel><title>Benchmark</title>{items}</channel></rss>"
+    )
+    return ET.fromstring(xml).find('channel')
+
+
+def legacy_extract_episode(item: ET.Element) -> dict:
+    """Extract an episode the way parse_feed did before the single-pass extractor."""
+    itunes_ns = {'itunes': ITUNES_NS}
+    episode = {
+        "title": _get_element_text(item, 'title', 'Unknown Episode'),
+        "description": _get_element_text(item, 'description', ''),
+        "link": _get_element_text(item, 'link', ''),
+        "guid": _get_element_text(item, 'guid', ''),
+        "pubDate": _get_element_text(item, 'pubDate', ''),
+        "published_date": _parse_date(_get_element_text(item, 'pubDate', '')),
+        "duration": _get_element_text(item, './/itunes:duration', '', namespaces=itunes_ns),
+        "explicit": _get_element_text(item, './/itunes:explicit', 'no', namespaces=itunes_ns),
+        "episode_type": _get_element_text(item, './/itunes:episodeType', 'full', namespaces=itunes_ns),
+    }
+    enclosure = item.find('enclosure')
+    if enclosure is not None:
+        episode['audio_url'] = enclosure.get('url', '')
+        episode['type'] = enclosure.get('type', '')
+        episode['length'] = enclosure.get('length', '')
+    else:
+        episode['audio_url'] = ''
+        episode['type'] = ''
+        episode['length'] = ''
+    return episode
+
+
+def main():
+    """Run the episode extraction microbenchmark."""
+    items = build_feed(500).findall('item')
+    repeat = 20
+    
+    legacy = min(timeit.repeat(
+        lambda: [legacy_extract_episode(item) for item in items],
+        number=1,
+        repeat=repeat,
+    ))
+    single_pass = min(timeit.repeat(
+        lambda: [_extract_episode(item) for item in items],
+        number=1,
+        repeat=repeat,
+    ))
+    
+    print(f"Items per run:         {len(items)}")
+    print(f"Legacy XPath lookups:  {legacy * 1000:.2f} ms")
+    print(f"Single-pass extractor: {single_pass * 1000:.2f} ms")
+    print(f"Speedup:               {legacy / single_pass:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
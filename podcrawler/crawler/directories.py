@@ -0,0 +1,439 @@
+"""
+Podcast Directory Adapters.
+
+This module describes how to search individual podcast directories and caches
+the feed URLs found for each topic.
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import quote, quote_plus, urlparse
+import hashlib
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+
+import requests
+from scrapy.http import TextResponse
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+# User agent for requests
+USER_AGENT = "PodCrawlerMCP/0.1.0 (+https://github.com/infinitimeless/podcrawler-mcp)"
+
+# Where directory search results are cached between runs
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.join(os.path.expanduser("~"), ".cache")),
+    "podcrawler",
+    "directories",
+)
+
+# How long cached search results stay valid (seconds)
+DEFAULT_CACHE_TTL = 24 * 60 * 60
+
+# CSS selectors tried on every directory's search results
+GENERIC_SELECTORS = (
+    'link[type="application/rss+xml"]::attr(href)',
+    'a[href*=".rss"]::attr(href)',
+    'a[href*="feed"]::attr(href)',
+    'a[href*="itunes.apple.com"]::attr(href)',
+    'a[href*="podcasts.apple.com"]::attr(href)',
+    'a[href*="spotify.com/show"]::attr(href)',
+)
+
+
+
+def quote_path(text: str) -> str:
+    """URL-encode text for use as a single URL path segment."""
+    return quote(text, safe='')
+
+
+def extract_itunes_feeds(response: TextResponse) -> List[str]:
+    """Extract RSS feed URLs from an iTunes Search API response.
+
+    Args:
+        response: Scrapy TextResponse holding the JSON search results
+
+    Returns:
+        List of RSS feed URLs
+    """
+    try:
+        results = json.loads(response.text).get("results", [])
+    except (ValueError, AttributeError):
+        logger.warning(f"Invalid iTunes search response from {response.url}")
+        return []
+
+    return [
+        result["feedUrl"]
+        for result in results
+        if isinstance(result, dict) and result.get("feedUrl")
+    ]
+
+
+# Settings for directories with a known search layout, keyed by host.
+# Directories without an ``extractor`` are scraped with GENERIC_SELECTORS.
+KNOWN_DIRECTORIES: Dict[str, Dict[str, Any]] = {
+    "itunes.apple.com": {
+        "name": "itunes",
+        "search_url": "https://itunes.apple.com/search?media=podcast&entity=podcast&limit=50&term={query}",
+        "extractor": extract_itunes_feeds,
+        "delay": (0.0, 0.5),
+    },
+    "podcastindex.org": {
+        "name": "podcastindex",
+        "search_url": "https://podcastindex.org/search?q={query}",
+    },
+    "www.listennotes.com": {
+        "name": "listennotes",
+        "search_url": "https://www.listennotes.com/search/?q={query}&type=podcast&offset={offset}",
+        "max_pages": 2,
+        "page_size": 10,
+        "delay": (2.0, 4.0),
+    },
+    "player.fm": {
+        "name": "playerfm",
+        "search_url": "https://player.fm/search/{query}?page={page}",
+        "quote_query": quote_path,
+        "max_pages": 2,
+    },
+}
+
+
+class DirectoryCache:
+    """Persistent cache of topic to feed URL results for a single directory.
+
+    Use get_cache() so every adapter writing a file shares one instance.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the cache.
+
+        Args:
+            path: JSON file the cache is stored in
+        """
+        self.path = path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(topic: str) -> str:
+        """Normalize a topic into a cache key."""
+        return " ".join(topic.lower().split())
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """Read the cache file, returning no entries if it is missing or unreadable."""
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                return data
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable directory cache {self.path}: {str(e)}")
+        return {}
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load the cache file on first use."""
+        if self._entries is None:
+            self._entries = self._read()
+        return self._entries
+
+    def get(self, topic: str, ttl: float = DEFAULT_CACHE_TTL) -> Optional[List[str]]:
+        """Get cached feed URLs for a topic.
+
+        Args:
+            topic: The topic that was searched for
+            ttl: Seconds a cached result stays valid
+
+        Returns:
+            List of feed URLs, or None if there is no fresh entry
+        """
+        with self._lock:
+            entry = self._load().get(self._key(topic))
+        if entry is None or time.time() - entry.get("time", 0) > ttl:
+            return None
+        return list(entry.get("urls", []))
+
+    def set(self, topic: str, urls: List[str], ttl: float = DEFAULT_CACHE_TTL) -> None:
+        """Store feed URLs for a topic and persist the cache.
+
+        Args:
+            topic: The topic that was searched for
+            urls: Feed URLs found for the topic
+            ttl: Seconds a cached result stays valid, used to prune the file
+        """
+        now = time.time()
+        with self._lock:
+            entries = self._load()
+            entries[self._key(topic)] = {"time": now, "urls": list(urls)}
+
+            # Merge entries written by other processes since the file was loaded
+            for key, entry in self._read().items():
+                if entry.get("time", 0) > entries.get(key, {}).get("time", 0):
+                    entries[key] = entry
+
+            # Drop expired entries so the file does not grow without bound
+            for key in [k for k, v in entries.items() if now - v.get("time", 0) > ttl]:
+                del entries[key]
+
+            try:
+                directory = os.path.dirname(self.path) or "."
+                os.makedirs(directory, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "w", encoding='utf-8') as f:
+                        json.dump(entries, f)
+                    os.replace(tmp_path, self.path)
+                except BaseException:
+                    os.unlink(tmp_path)
+                    raise
+            except Exception as e:
+                logger.warning(f"Failed to write directory cache {self.path}: {str(e)}")
+
+
+_caches: Dict[str, DirectoryCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache(path: str) -> DirectoryCache:
+    """Get the shared cache for a cache file.
+
+    Args:
+        path: JSON file the cache is stored in
+
+    Returns:
+        The directory cache
+    """
+    path = os.path.abspath(path)
+    with _caches_lock:
+        cache = _caches.get(path)
+        if cache is None:
+            cache = _caches[path] = DirectoryCache(path)
+        return cache
+
+
+class DirectoryAdapter:
+    """Searches a single podcast directory for RSS feeds."""
+
+    def __init__(
+        self,
+        name: str,
+        search_url: str,
+        selectors: Sequence[str] = (),
+        extractor: Optional[Callable[[TextResponse], List[str]]] = None,
+        quote_query: Callable[[str], str] = quote_plus,
+        max_pages: int = 1,
+        page_size: int = 10,
+        delay: Tuple[float, float] = (1.0, 3.0),
+        timeout: float = 10,
+        cache_dir: Optional[str] = None,
+        cache_ttl: float = DEFAULT_CACHE_TTL,
+    ):
+        """Initialize the adapter.
+
+        Args:
+            name: Short name of the directory, used in its cache file name
+            search_url: Search URL template; ``{query}`` is replaced by the
+                encoded topic, ``{page}`` and ``{offset}`` by the 1-based
+                page number and the result offset of the page
+            selectors: Directory-specific CSS selectors for result links,
+                tried before the generic ones
+            extractor: Directory-specific function returning the feed URLs
+                of a results page, used instead of the CSS selectors
+            quote_query: Function encoding the topic, quote_plus for query
+                strings or quote_path for path segments
+            max_pages: Maximum number of result pages to fetch
+            page_size: Number of results per page, used for ``{offset}``
+            delay: Range of seconds to wait before each request
+            timeout: Request timeout in seconds
+            cache_dir: Directory for the result cache file
+            cache_ttl: Seconds a cached result stays valid
+        """
+        self.name = name
+        self.search_url = search_url
+        self.selectors = tuple(selectors) + GENERIC_SELECTORS
+        self.extractor = extractor
+        self.quote_query = quote_query
+        self.max_pages = max_pages
+        self.page_size = page_size
+        self.delay = delay
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+
+        # Key the cache file on the search template so directories on the
+        # same host, or with different layouts, never share results
+        digest = hashlib.sha1(search_url.encode('utf-8')).hexdigest()[:12]
+        self.cache = get_cache(
+            os.path.join(cache_dir or DEFAULT_CACHE_DIR, f"{name}-{digest}.json")
+        )
+        # Serializes requests so concurrent searches stay polite to the directory
+        self._request_lock = threading.Lock()
+
+    def page_url(self, topic: str, page: int) -> str:
+        """Build the search URL for a page of results.
+
+        Args:
+            topic: The topic to search for
+            page: 1-based page number
+
+        Returns:
+            The search URL
+        """
+        return self.search_url.format(
+            query=self.quote_query(topic),
+            page=page,
+            offset=(page - 1) * self.page_size,
+        )
+
+    def search(self, topic: str) -> List[str]:
+        """Find RSS feed URLs for a topic, using the cache when possible.
+
+        Args:
+            topic: The topic to search for
+
+        Returns:
+            List of discovered RSS feed URLs
+        """
+        cached = self.cache.get(topic, self.cache_ttl)
+        if cached is not None:
+            return cached
+
+        feed_urls: List[str] = []
+        failed = False
+        paginated = "{page}" in self.search_url or "{offset}" in self.search_url
+
+        for page in range(1, (self.max_pages if paginated else 1) + 1):
+            response = self._fetch(self.page_url(topic, page))
+            if response is None:
+                failed = True
+                break
+
+            new_urls = [url for url in self.extract(response) if url not in feed_urls]
+            if not new_urls:
+                break
+            feed_urls.extend(new_urls)
+
+        # Only cache complete, non-empty results so a failed request or a
+        # block page does not hide the directory for the whole TTL
+        if feed_urls and not failed:
+            self.cache.set(topic, feed_urls, self.cache_ttl)
+
+        return feed_urls
+
+    def _fetch(self, url: str) -> Optional[TextResponse]:
+        """Fetch a search results page.
+
+        Args:
+            url: URL of the page
+
+        Returns:
+            Scrapy TextResponse, or None if the request failed
+        """
+        try:
+            with self._request_lock:
+                # Respect robots.txt by adding a delay
+                time.sleep(random.uniform(*self.delay))
+
+                response = requests.get(
+                    url,
+                    headers={"User-Agent": USER_AGENT},
+                    timeout=self.timeout
+                )
+
+            if response.status_code != 200:
+                logger.warning(f"Failed to crawl {url}: HTTP {response.status_code}")
+                return None
+
+            # Create a Scrapy TextResponse for easier parsing
+            return TextResponse(url=url, body=response.content, encoding='utf-8')
+
+        except Exception as e:
+            logger.error(f"Error crawling {url}: {str(e)}")
+            return None
+
+    def extract(self, response: TextResponse) -> List[str]:
+        """Extract RSS feed URLs from a search results page.
+
+        Args:
+            response: Scrapy TextResponse object
+
+        Returns:
+            List of RSS feed URLs
+        """
+        if self.extractor is not None:
+            return list(dict.fromkeys(self.extractor(response)))
+
+        feed_urls = []
+        for selector in self.selectors:
+            feed_urls.extend(response.css(selector).getall())
+
+        # Process relative URLs
+        processed_urls = []
+        for url in feed_urls:
+            # Convert relative URLs to absolute
+            absolute_url = response.urljoin(url)
+
+            # Check if it's a valid feed URL
+            if (absolute_url.endswith('.rss') or
+                absolute_url.endswith('.xml') or
+                'feed' in absolute_url.lower() or
+                'rss' in absolute_url.lower() or
+                'podcast' in absolute_url.lower()):
+                if absolute_url not in processed_urls:
+                    processed_urls.append(absolute_url)
+
+        return processed_urls
+
+
+def create_adapter(
+    directory_url: str,
+    cache_dir: Optional[str] = None,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+) -> DirectoryAdapter:
+    """Create the adapter for a podcast directory.
+
+    Known directories get their own search layout; any other directory falls
+    back to a generic ``/search?q=`` search.
+
+    Args:
+        directory_url: URL of the podcast directory
+        cache_dir: Directory for the result cache file
+        cache_ttl: Seconds a cached result stays valid
+
+    Returns:
+        The directory adapter
+    """
+    host = urlparse(directory_url).netloc.lower()
+    settings = KNOWN_DIRECTORIES.get(host)
+    if settings is None:
+        settings = {
+            "name": host or "directory",
+            "search_url": directory_url.rstrip('/').replace('{', '{{').replace('}', '}}')
+            + "/search?q={query}",
+        }
+
+    return DirectoryAdapter(cache_dir=cache_dir, cache_ttl=cache_ttl, **settings)
+
+
+_adapters: Dict[str, DirectoryAdapter] = {}
+_adapters_lock = threading.Lock()
+
+
+def get_adapter(directory_url: str) -> DirectoryAdapter:
+    """Get the shared, default-configured adapter for a podcast directory.
+
+    Args:
+        directory_url: URL of the podcast directory
+
+    Returns:
+        The directory adapter
+    """
+    with _adapters_lock:
+        adapter = _adapters.get(directory_url)
+        if adapter is None:
+            adapter = _adapters[directory_url] = create_adapter(directory_url)
+        return adapter
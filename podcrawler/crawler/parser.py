@@ -15,6 +15,45 @@ logger = logging.getLogger(__name__)
 # User agent for requests
 USER_AGENT = "PodCrawlerMCP/0.1.0 (+https://github.com/infinitimeless/podcrawler-mcp)"
 
+# XML namespaces used by podcast feeds
+ITUNES_NS = "http://www.itunes.com/dtds/podcast-1.0.dtd"
+PODCAST_NS = "https://podcastindex.org/namespace/1.0"
+PODCAST_NS_LEGACY = "https://github.com/Podcastindex-org/podcast-namespace/blob/main/docs/1.0.md"
+
+# Item child tags (in Clark notation) whose text maps onto an episode field
+_ITEM_TEXT_FIELDS = {
+    "title": "title",
+    "description": "description",
+    "link": "link",
+    "guid": "guid",
+    "pubDate": "pubDate",
+    f"{{{ITUNES_NS}}}duration": "duration",
+    f"{{{ITUNES_NS}}}explicit": "explicit",
+    f"{{{ITUNES_NS}}}episodeType": "episode_type",
+}
+
+# Defaults for episode text fields missing from an item
+_ITEM_TEXT_DEFAULTS = {
+    "title": "Unknown Episode",
+    "description": "",
+    "link": "",
+    "guid": "",
+    "pubDate": "",
+    "duration": "",
+    "explicit": "no",
+    "episode_type": "full",
+}
+
+_ENCLOSURE_TAG = "enclosure"
+
+# Podcasting 2.0 tags, accepted under both the current and legacy namespace URIs
+_TRANSCRIPT_TAGS = frozenset(
+    f"{{{ns}}}transcript" for ns in (PODCAST_NS, PODCAST_NS_LEGACY)
+)
+_CHAPTERS_TAGS = frozenset(
+    f"{{{ns}}}chapters" for ns in (PODCAST_NS, PODCAST_NS_LEGACY)
+)
+
 def parse_feed(feed_url: str) -> Dict[str, Any]:
     """Parse a podcast RSS feed to extract podcast and episode information.
     
@@ -58,7 +97,7 @@ def parse_feed(feed_url: str) -> Dict[str, Any]:
         }
         
         # Extract iTunes-specific elements
-        itunes_ns = {'itunes': 'http://www.itunes.com/dtds/podcast-1.0.dtd'}
+        itunes_ns = {'itunes': ITUNES_NS}
         podcast_info['author'] = _get_element_text(
             channel, 
             './/itunes:author', 
@@ -80,47 +119,8 @@ def parse_feed(feed_url: str) -> Dict[str, Any]:
         )
         
         # Extract episodes
-        items = channel.findall('item')
-        for item in items:
-            episode = {
-                "title": _get_element_text(item, 'title', 'Unknown Episode'),
-                "description": _get_element_text(item, 'description', ''),
-                "link": _get_element_text(item, 'link', ''),
-                "guid": _get_element_text(item, 'guid', ''),
-                "pubDate": _get_element_text(item, 'pubDate', ''),
-                "published_date": _parse_date(_get_element_text(item, 'pubDate', '')),
-                "duration": _get_element_text(
-                    item, 
-                    './/itunes:duration', 
-                    '', 
-                    namespaces=itunes_ns
-                ),
-                "explicit": _get_element_text(
-                    item, 
-                    './/itunes:explicit', 
-                    'no', 
-                    namespaces=itunes_ns
-                ),
-                "episode_type": _get_element_text(
-                    item, 
-                    './/itunes:episodeType', 
-                    'full', 
-                    namespaces=itunes_ns
-                ),
-            }
-            
-            # Get the audio URL from the enclosure
-            enclosure = item.find('enclosure')
-            if enclosure is not None:
-                episode['audio_url'] = enclosure.get('url', '')
-                episode['type'] = enclosure.get('type', '')
-                episode['length'] = enclosure.get('length', '')
-            else:
-                episode['audio_url'] = ''
-                episode['type'] = ''
-                episode['length'] = ''
-            
-            podcast_info['episodes'].append(episode)
+        for item in channel.findall('item'):
+            podcast_info['episodes'].append(_extract_episode(item))
         
         return podcast_info
         
@@ -129,6 +129,80 @@ def parse_feed(feed_url: str) -> Dict[str, Any]:
         return {"title": "Unknown", "description": "", "episodes": []}
 
 
+def _extract_episode(item: ET.Element) -> Dict[str, Any]:
+    """Extract episode information from an RSS item in a single pass.
+    
+    Each direct child of the item is visited once and dispatched on its
+    Clark-notation tag. As with ``Element.find``, the first matching child
+    wins for single-valued fields.
+    
+    Args:
+        item: The <item> XML element
+    
+    Returns:
+        Dict containing episode information
+    """
+    text_fields = dict(_ITEM_TEXT_DEFAULTS)
+    seen = set()
+    enclosure = None
+    chapters = None
+    transcripts: List[Dict[str, str]] = []
+    
+    for child in item:
+        tag = child.tag
+        field = _ITEM_TEXT_FIELDS.get(tag)
+        if field is not None:
+            if field not in seen:
+                seen.add(field)
+                if child.text is not None:
+                    text_fields[field] = child.text.strip()
+        elif tag == _ENCLOSURE_TAG:
+            if enclosure is None:
+                enclosure = child
+        elif tag in _TRANSCRIPT_TAGS:
+            transcripts.append({
+                "url": child.get('url', ''),
+                "type": child.get('type', ''),
+                "language": child.get('language', ''),
+            })
+        elif tag in _CHAPTERS_TAGS:
+            if chapters is None:
+                chapters = child
+    
+    episode = {
+        "title": text_fields["title"],
+        "description": text_fields["description"],
+        "link": text_fields["link"],
+        "guid": text_fields["guid"],
+        "pubDate": text_fields["pubDate"],
+        "published_date": _parse_date(text_fields["pubDate"]),
+        "duration": text_fields["duration"],
+        "explicit": text_fields["explicit"],
+        "episode_type": text_fields["episode_type"],
+    }
+    
+    # Get the audio URL from the enclosure
+    if enclosure is not None:
+        episode['audio_url'] = enclosure.get('url', '')
+        episode['type'] = enclosure.get('type', '')
+        episode['length'] = enclosure.get('length', '')
+    else:
+        episode['audio_url'] = ''
+        episode['type'] = ''
+        episode['length'] = ''
+    
+    # Podcasting 2.0 extensions
+    episode['transcripts'] = transcripts
+    if chapters is not None:
+        episode['chapters_url'] = chapters.get('url', '')
+        episode['chapters_type'] = chapters.get('type', '')
+    else:
+        episode['chapters_url'] = ''
+        episode['chapters_type'] = ''
+    
+    return episode
+
+
 def _get_element_text(element: ET.Element, path: str, default: str, namespaces: Dict[str, str] = None) -> str:
     """Get the text content of an XML element.
     
@@ -7,9 +7,11 @@ from typing import Dict, List, Any, Optional
 
 from mcp.server.fastmcp import FastMCP
 
-from podcrawler.crawler.spider import crawl_directory
+from podcrawler.crawler.directories import DEFAULT_CACHE_TTL, create_adapter
+from podcrawler.crawler.spider import DEFAULT_DIRECTORIES, crawl_directory
 from podcrawler.crawler.parser import parse_feed
 from podcrawler.utils.filtering import filter_by_topic
+from podcrawler.utils.query import QueryAnalyzer, load_synonyms
 from podcrawler.utils.formatting import format_podcast_results
 
 
@@ -22,6 +24,22 @@ def register_discovery_tool(mcp: FastMCP, config: Optional[Dict[str, Any]] = Non
     """
     config = config or {}
     
+    # Load the related-terms table once at startup
+    synonyms = config.get('synonyms')
+    if config.get('synonyms_file'):
+        synonyms = load_synonyms(config['synonyms_file'])
+    analyzer = QueryAnalyzer(synonyms)
+    
+    # Build the directory adapters (and their result caches) once at startup
+    adapters = [
+        create_adapter(
+            directory_url,
+            cache_dir=config.get('directory_cache_dir'),
+            cache_ttl=config.get('directory_cache_ttl', DEFAULT_CACHE_TTL),
+        )
+        for directory_url in config.get('directories') or DEFAULT_DIRECTORIES
+    ]
+    
     @mcp.tool()
     async def discover_podcasts(topic: str, max_results: int = 10) -> str:
         """Discover podcasts on a specific topic.
@@ -35,11 +53,14 @@ def register_discovery_tool(mcp: FastMCP, config: Optional[Dict[str, Any]] = Non
         """
         try:
             # Step 1: Crawl podcast directory for RSS feeds
-            feeds = crawl_directory(topic, config.get('directories'))
+            feeds = crawl_directory(topic, adapters)
             
             if not feeds:
                 return f"No podcast feeds found for topic: {topic}"
             
+            # Analyze the topic once and share it across all feeds
+            query = analyzer.compile(topic)
+            
             results: List[Dict[str, Any]] = []
             total_episodes = 0
             
@@ -49,7 +70,7 @@ def register_discovery_tool(mcp: FastMCP, config: Optional[Dict[str, Any]] = Non
                     podcast_data = parse_feed(feed_url)
                     
                     # Step 3: Filter episodes by topic
-                    relevant_episodes = filter_by_topic(podcast_data, topic)
+                    relevant_episodes = filter_by_topic(podcast_data, query)
                     
                     if relevant_episodes:
                         podcast_info = {
@@ -0,0 +1,262 @@
+"""
+Topic Query Analysis Utilities.
+
+This module turns a topic string into a compiled query of stemmed terms that
+can be matched against podcast episodes.
+"""
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Any
+from functools import lru_cache
+import json
+import re
+
+# Pattern used to split text into word tokens
+TOKEN_PATTERN = re.compile(r'\w+')
+
+# Words that carry no topical meaning and are ignored when matching
+STOPWORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+    "into", "is", "it", "of", "on", "or", "that", "the", "to", "with",
+})
+
+# Words whose trailing "s", "-ed" or "-ing" is not an inflection
+INVARIANT_WORDS = frozenset({
+    "news", "series", "species", "physics", "politics", "economics",
+    "mathematics", "ethics", "genetics", "linguistics", "statistics",
+    "analysis", "thesis", "crisis", "basis", "bias", "chaos", "cosmos",
+    "business", "wellness", "fitness", "success", "gas", "lens",
+    "anything", "everything", "nothing", "something", "thing", "spring",
+    "string", "ceiling", "evening", "morning", "wedding", "bed", "seed",
+    "speed", "feed", "need", "breed", "greed", "diagnosis",
+})
+
+# Plurals the suffix rules cannot reduce to their singular's stem
+IRREGULAR_PLURALS = {
+    "crises": "crisis",
+    "theses": "thesis",
+    "analyses": "analysis",
+    "diagnoses": "diagnosis",
+    "biases": "bias",
+    "gases": "gas",
+    "lenses": "lens",
+    "buses": "bus",
+    "quizzes": "quiz",
+}
+
+# Words with a fixed stem, checked before and after plural removal
+_EXCEPTIONS: Dict[str, str] = {
+    **{word: word for word in INVARIANT_WORDS},
+    **IRREGULAR_PLURALS,
+}
+
+_VOWELS = frozenset("aeiou")
+
+
+def _is_consonant(word: str, i: int) -> bool:
+    """Check whether the letter at position i is a consonant ("y" after a consonant is a vowel)."""
+    letter = word[i]
+    if letter in _VOWELS:
+        return False
+    if letter == 'y':
+        return i == 0 or not _is_consonant(word, i - 1)
+    return True
+
+
+def _measure(word: str) -> int:
+    """Count the vowel-consonant sequences in a word (Porter's "m")."""
+    count = 0
+    previous_vowel = False
+    for i in range(len(word)):
+        consonant = _is_consonant(word, i)
+        if consonant and previous_vowel:
+            count += 1
+        previous_vowel = not consonant
+    return count
+
+
+def _has_vowel(word: str) -> bool:
+    """Check whether a word contains a vowel."""
+    return any(not _is_consonant(word, i) for i in range(len(word)))
+
+
+def _ends_cvc(word: str) -> bool:
+    """Check whether a word ends consonant-vowel-consonant, the last not w, x or y."""
+    return (
+        len(word) >= 3
+        and _is_consonant(word, len(word) - 3)
+        and not _is_consonant(word, len(word) - 2)
+        and _is_consonant(word, len(word) - 1)
+        and word[-1] not in "wxy"
+    )
+
+
+@lru_cache(maxsize=16384)
+def stem(word: str) -> str:
+    """Reduce a lowercase word to its stem.
+
+    This is a light stemmer covering the inflectional steps of the Porter
+    algorithm (1a plurals, 1b "-ed"/"-ing", 1c terminal "y" and 5a final
+    "e"), which are the forms that matter for topic matching. Step 5a also
+    reduces "-es" plurals such as "boxes" and "churches" to their singular.
+
+    Args:
+        word: Lowercase word to stem
+
+    Returns:
+        The stemmed word
+    """
+    if len(word) <= 2 or not word.isalpha():
+        return word
+    if word in _EXCEPTIONS:
+        return _EXCEPTIONS[word]
+
+    # Step 1a: plurals
+    if word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('ies'):
+        word = word[:-2]
+    elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')):
+        word = word[:-1]
+
+    # Plurals of invariant words ("mornings") keep the singular's stem
+    if word in _EXCEPTIONS:
+        return _EXCEPTIONS[word]
+
+    # Step 1b: past tense and gerunds
+    if word.endswith('eed'):
+        if _measure(word[:-3]) > 0:
+            word = word[:-1]
+    else:
+        for suffix in ('ing', 'ed'):
+            if word.endswith(suffix) and _has_vowel(word[:-len(suffix)]):
+                word = word[:-len(suffix)]
+                if word.endswith(('at', 'bl', 'iz')):
+                    word += 'e'
+                elif (len(word) >= 2 and word[-1] == word[-2]
+                      and _is_consonant(word, len(word) - 1) and word[-1] not in "lsz"):
+                    word = word[:-1]
+                elif _measure(word) == 1 and _ends_cvc(word):
+                    word += 'e'
+                break
+
+    # Step 1c: terminal "y" after a vowel-bearing stem
+    if word.endswith('y') and _has_vowel(word[:-1]):
+        word = word[:-1] + 'i'
+
+    # Step 5a: final "e"
+    if word.endswith('e'):
+        base = word[:-1]
+        measure = _measure(base)
+        if measure > 1 or (measure == 1 and not _ends_cvc(base)):
+            word = base
+
+    return word
+
+
+def analyze(text: str) -> Set[str]:
+    """Split text into the set of stemmed, non-stopword terms it contains.
+
+    Args:
+        text: Text to analyze
+
+    Returns:
+        Set of stemmed terms
+    """
+    return {
+        stem(token)
+        for token in TOKEN_PATTERN.findall(text.lower())
+        if token not in STOPWORDS
+    }
+
+
+def load_synonyms(path: str) -> Dict[str, List[str]]:
+    """Load a synonym/related-terms table from a JSON file.
+
+    The file must contain an object mapping a term (or phrase) to a list of
+    related terms, e.g. ``{"ai": ["artificial intelligence", "machine learning"]}``.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Mapping of terms to related terms
+    """
+    with open(path, encoding='utf-8') as f:
+        table = json.load(f)
+
+    if not isinstance(table, dict):
+        raise ValueError(f"Synonym table in {path} must be a JSON object")
+
+    return {str(term): [str(related) for related in terms] for term, terms in table.items()}
+
+
+class CompiledQuery:
+    """A topic analyzed once and shared across all feeds of a discovery."""
+
+    __slots__ = ("topic", "terms")
+
+    def __init__(self, topic: str, terms: FrozenSet[str]):
+        """Initialize the compiled query.
+
+        Args:
+            topic: The original topic string
+            terms: Stemmed terms to match, including related terms
+        """
+        self.topic = topic
+        self.terms = terms
+
+    def score(self, episode: Dict[str, Any]) -> float:
+        """Calculate relevance score of an episode to this query.
+
+        Args:
+            episode: Episode data
+
+        Returns:
+            Relevance score between 0.0 and 1.0
+        """
+        title_terms = analyze(episode.get('title', ''))
+        desc_terms = analyze(episode.get('description', ''))
+
+        # Title matches are more important
+        title_score = len(title_terms & self.terms) / max(len(title_terms), 1)
+        desc_score = len(desc_terms & self.terms) / max(len(desc_terms), 1)
+
+        # Weight title matches higher
+        return (title_score * 0.7) + (desc_score * 0.3)
+
+
+class QueryAnalyzer:
+    """Compiles topic strings into queries, expanding them with related terms."""
+
+    def __init__(self, synonyms: Optional[Dict[str, Iterable[str]]] = None):
+        """Initialize the analyzer.
+
+        Args:
+            synonyms: Optional mapping of terms (or phrases) to related terms
+        """
+        # Pre-analyze the table so compiling a query is only set operations
+        self._expansions: List[Tuple[FrozenSet[str], FrozenSet[str]]] = []
+        for term, related in (synonyms or {}).items():
+            key = frozenset(analyze(term))
+            if not key:
+                continue
+            expansion: Set[str] = set()
+            for phrase in related:
+                expansion |= analyze(phrase)
+            self._expansions.append((key, frozenset(expansion)))
+
+    def compile(self, topic: str) -> CompiledQuery:
+        """Compile a topic into a query.
+
+        Args:
+            topic: Topic to compile
+
+        Returns:
+            The compiled query
+        """
+        base_terms = analyze(topic)
+        terms = set(base_terms)
+        for key, expansion in self._expansions:
+            if key <= base_terms:
+                terms |= expansion
+
+        return CompiledQuery(topic, frozenset(terms))
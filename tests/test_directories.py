@@ -0,0 +1,145 @@
+"""
+Unit tests for the podcast directory adapters.
+"""
+from scrapy.http import TextResponse
+
+from podcrawler.crawler.directories import (
+    DirectoryAdapter,
+    DirectoryCache,
+    create_adapter,
+    get_cache,
+)
+
+# Trimmed response of https://itunes.apple.com/search?media=podcast&term=black+holes
+ITUNES_RESPONSE = b"""{
+ "resultCount": 3,
+ "results": [
+  {"wrapperType": "track", "kind": "podcast", "collectionName": "Black Holes Explained",
+   "collectionViewUrl": "https://podcasts.apple.com/us/podcast/black-holes/id111",
+   "feedUrl": "https://feeds.example.com/black-holes.xml"},
+  {"wrapperType": "track", "kind": "podcast", "collectionName": "No Feed",
+   "collectionViewUrl": "https://podcasts.apple.com/us/podcast/no-feed/id222"},
+  {"wrapperType": "track", "kind": "podcast", "collectionName": "Space Hour",
+   "collectionViewUrl": "https://podcasts.apple.com/us/podcast/space-hour/id333",
+   "feedUrl": "https://anchor.fm/s/abc/podcast/rss"}
+ ]
+}"""
+
+
+def test_page_url_encodes_topic(tmp_path):
+    """Test that the topic is URL-encoded and pagination fields are filled in."""
+    adapter = DirectoryAdapter(
+        "test",
+        "https://example.com/search?q={query}&page={page}&offset={offset}",
+        page_size=20,
+        cache_dir=str(tmp_path),
+    )
+    assert adapter.page_url("black holes & AI", 2) == (
+        "https://example.com/search?q=black+holes+%26+AI&page=2&offset=20"
+    )
+
+
+def test_create_adapter_known_and_generic(tmp_path):
+    """Test that known directories get their own adapter and others a generic one."""
+    known = create_adapter("https://www.listennotes.com/", cache_dir=str(tmp_path))
+    assert known.name == "listennotes"
+    
+    generic = create_adapter("https://podcasts.example.org/", cache_dir=str(tmp_path))
+    assert generic.name == "podcasts.example.org"
+    assert generic.page_url("history", 1) == "https://podcasts.example.org/search?q=history"
+
+
+def test_player_fm_encodes_topic_as_path(tmp_path):
+    """Test that a topic in a URL path is percent-encoded rather than plus-encoded."""
+    adapter = create_adapter("https://player.fm/", cache_dir=str(tmp_path))
+    assert adapter.page_url("black holes/AI", 2) == (
+        "https://player.fm/search/black%20holes%2FAI?page=2"
+    )
+
+
+def test_itunes_extract_returns_feed_urls(tmp_path):
+    """Test that the iTunes adapter returns the feed URLs of the search results."""
+    adapter = create_adapter("https://itunes.apple.com/", cache_dir=str(tmp_path))
+    response = TextResponse(
+        url=adapter.page_url("black holes", 1),
+        body=ITUNES_RESPONSE,
+        encoding='utf-8',
+    )
+    assert adapter.extract(response) == [
+        "https://feeds.example.com/black-holes.xml",
+        "https://anchor.fm/s/abc/podcast/rss",
+    ]
+
+
+def test_adapters_on_same_host_use_separate_caches(tmp_path):
+    """Test that directories on one host do not share a cache file."""
+    first = create_adapter("https://example.com/a/", cache_dir=str(tmp_path))
+    second = create_adapter("https://example.com/b/", cache_dir=str(tmp_path))
+    assert first.cache.path != second.cache.path
+    
+    # Adapters for the same directory share one cache instance
+    again = create_adapter("https://example.com/a/", cache_dir=str(tmp_path))
+    assert again.cache is first.cache
+
+
+def test_cache_persists_and_expires(tmp_path):
+    """Test that cached results survive a reload and expire after the TTL."""
+    path = str(tmp_path / "test.json")
+    DirectoryCache(path).set("Black  Holes", ["https://example.com/feed.rss"])
+    
+    assert DirectoryCache(path).get("black holes") == ["https://example.com/feed.rss"]
+    assert DirectoryCache(path).get("black holes", ttl=-1) is None
+
+
+def test_cache_keeps_entries_written_by_other_instances(tmp_path):
+    """Test that saving one topic does not drop topics saved elsewhere."""
+    path = str(tmp_path / "test.json")
+    first = DirectoryCache(path)
+    second = DirectoryCache(path)
+    first.get("science")
+    
+    second.set("history", ["https://example.com/history.rss"])
+    first.set("science", ["https://example.com/science.rss"])
+    
+    assert DirectoryCache(path).get("history") == ["https://example.com/history.rss"]
+    assert get_cache(path) is get_cache(str(tmp_path / "." / "test.json"))
+
+
+def test_search_uses_cache(tmp_path, monkeypatch):
+    """Test that a repeated search is answered from the cache."""
+    adapter = DirectoryAdapter("test", "https://example.com/search?q={query}", cache_dir=str(tmp_path))
+    calls = []
+    
+    def fake_fetch(url):
+        calls.append(url)
+        return object()
+    
+    monkeypatch.setattr(adapter, "_fetch", fake_fetch)
+    monkeypatch.setattr(adapter, "extract", lambda response: ["https://example.com/feed.rss"])
+    
+    assert adapter.search("science") == ["https://example.com/feed.rss"]
+    assert adapter.search("science") == ["https://example.com/feed.rss"]
+    assert len(calls) == 1
+
+
+def test_search_does_not_cache_empty_or_failed_results(tmp_path, monkeypatch):
+    """Test that empty results and failed pages are not cached."""
+    adapter = DirectoryAdapter(
+        "test",
+        "https://example.com/search?q={query}&page={page}",
+        max_pages=2,
+        cache_dir=str(tmp_path),
+    )
+    responses = iter([object(), object(), None])
+    results = iter([[], ["https://example.com/feed.rss"]])
+    
+    monkeypatch.setattr(adapter, "_fetch", lambda url: next(responses))
+    monkeypatch.setattr(adapter, "extract", lambda response: next(results))
+    
+    # Page 1 has no matches
+    assert adapter.search("science") == []
+    assert adapter.cache.get("science") is None
+    
+    # Page 1 matches but page 2 fails
+    assert adapter.search("science") == ["https://example.com/feed.rss"]
+    assert adapter.cache.get("science") is None
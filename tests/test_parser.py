@@ -0,0 +1,59 @@
+"""
+Unit tests for the RSS feed parser.
+"""
+import xml.etree.ElementTree as ET
+
+from podcrawler.crawler.parser import ITUNES_NS, PODCAST_NS, _extract_episode
+
+
+def _item(body: str) -> ET.Element:
+    """Build an <item> element with the iTunes and Podcasting 2.0 namespaces bound."""
+    xml = (
+        f'<rss xmlns:itunes="{ITUNES_NS}" xmlns:podcast="{PODCAST_NS}">'
+        f"<channel><item>{body}</item></channel></rss>"
+    )
+    return ET.fromstring(xml).find('channel/item')
+
+
+def test_extract_episode_fields():
+    """Test that standard and iTunes fields are extracted."""
+    episode = _extract_episode(_item(
+        "<title> Black Holes </title>"
+        "<pubDate>Mon, 02 Jan 2023 10:00:00 +0000</pubDate>"
+        '<enclosure url="https://example.com/a.mp3" type="audio/mpeg" length="10"/>'
+        "<itunes:duration>42:00</itunes:duration>"
+        "<itunes:episodeType>bonus</itunes:episodeType>"
+    ))
+    assert episode["title"] == "Black Holes"
+    assert episode["published_date"] == "2023-01-02"
+    assert episode["audio_url"] == "https://example.com/a.mp3"
+    assert episode["duration"] == "42:00"
+    assert episode["episode_type"] == "bonus"
+    assert episode["explicit"] == "no"
+
+
+def test_extract_episode_defaults():
+    """Test that missing fields fall back to defaults."""
+    episode = _extract_episode(_item(""))
+    assert episode["title"] == "Unknown Episode"
+    assert episode["audio_url"] == ""
+    assert episode["transcripts"] == []
+    assert episode["chapters_url"] == ""
+
+
+def test_extract_episode_podcasting_20():
+    """Test that Podcasting 2.0 transcript and chapters tags are extracted."""
+    episode = _extract_episode(_item(
+        '<podcast:transcript url="https://example.com/t.vtt" type="text/vtt"/>'
+        '<podcast:transcript url="https://example.com/t.srt" type="application/srt"'
+        ' language="en"/>'
+        '<podcast:chapters url="https://example.com/c.json"'
+        ' type="application/json+chapters"/>'
+    ))
+    assert [t["url"] for t in episode["transcripts"]] == [
+        "https://example.com/t.vtt",
+        "https://example.com/t.srt",
+    ]
+    assert episode["transcripts"][1]["language"] == "en"
+    assert episode["chapters_url"] == "https://example.com/c.json"
+    assert episode["chapters_type"] == "application/json+chapters"
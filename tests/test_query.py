@@ -0,0 +1,107 @@
+"""
+Unit tests for topic query analysis and filtering.
+"""
+from podcrawler.utils.filtering import filter_by_topic
+from podcrawler.utils.query import QueryAnalyzer, analyze, stem
+
+
+def test_stem_inflections():
+    """Test that plurals, past tense and gerunds share a stem."""
+    assert stem("stories") == stem("story")
+    assert stem("running") == stem("run")
+    assert stem("hoped") == stem("hoping") == stem("hope")
+    assert stem("visiting") == stem("visit")
+
+
+def test_stem_normalizes_final_e_and_y():
+    """Test that words ending in "e" or "y" share a stem with their inflections."""
+    assert stem("movies") == stem("movie")
+    assert stem("cookies") == stem("cookie")
+    assert stem("dancing") == stem("danced") == stem("dance")
+    assert stem("used") == stem("using") == stem("use")
+    assert stem("studied") == stem("study")
+
+
+def test_stem_es_plurals():
+    """Test that "-es" plurals after s, x, z, ch and sh are reduced."""
+    assert stem("boxes") == stem("box")
+    assert stem("churches") == stem("church")
+    assert stem("buses") == stem("bus")
+
+
+def test_stem_plurals_of_words_ending_in_e():
+    """Test that plurals of "-se"/"-ze" words match their singular."""
+    assert stem("cases") == stem("case")
+    assert stem("sizes") == stem("size")
+    assert stem("roses") == stem("rose")
+    assert stem("prizes") == stem("prize")
+
+
+def test_stem_plurals_of_invariant_words():
+    """Test that plurals of invariant and irregular words match their singular."""
+    assert stem("mornings") == stem("morning") == "morning"
+    assert stem("evenings") == stem("evening")
+    assert stem("weddings") == stem("wedding")
+    assert stem("ceilings") == stem("ceiling")
+    assert stem("crises") == stem("crisis") == "crisis"
+
+
+def test_stem_invariant_words():
+    """Test that words ending in an inflection-like suffix are left alone."""
+    assert stem("news") == "news"
+    assert stem("physics") == "physics"
+    assert stem("news") != stem("new")
+
+
+def test_analyze_drops_stopwords():
+    """Test that stopwords are not treated as topic terms."""
+    assert analyze("The History of Science") == {stem("history"), stem("science")}
+
+
+def test_compile_expands_related_terms():
+    """Test that related terms are added when their key phrase is in the topic."""
+    analyzer = QueryAnalyzer({"artificial intelligence": ["AI", "machine learning"]})
+    query = analyzer.compile("Artificial Intelligence")
+    assert {"ai", stem("machine"), stem("learning")} <= query.terms
+    assert "ai" not in analyzer.compile("artificial flavours").terms
+
+
+def test_filter_by_topic_with_compiled_query():
+    """Test that a compiled query ranks matching episodes first."""
+    podcast_data = {
+        "episodes": [
+            {"title": "Cooking at home", "description": "Recipes"},
+            {"title": "Black holes", "description": "Astronomy news"},
+            {"title": "Black holes explained", "description": "Holes in space"},
+        ]
+    }
+    query = QueryAnalyzer().compile("black hole")
+    episodes = filter_by_topic(podcast_data, query)
+    assert [e["title"] for e in episodes] == ["Black holes", "Black holes explained"]
+    assert filter_by_topic(podcast_data, "black hole") == episodes
+
+
+def test_filter_by_topic_matches_singular_titles():
+    """Test that a plural topic matches episodes using the singular form."""
+    podcast_data = {
+        "episodes": [
+            {"title": "Best movie of the year", "description": ""},
+            {"title": "Cookie recipe", "description": ""},
+        ]
+    }
+    assert [e["title"] for e in filter_by_topic(podcast_data, "movies")] == ["Best movie of the year"]
+    assert [e["title"] for e in filter_by_topic(podcast_data, "cookies")] == ["Cookie recipe"]
+
+
+def test_filter_by_topic_matches_plural_topics():
+    """Test plural topics whose singular ends in "e" or is an invariant word."""
+    podcast_data = {
+        "episodes": [
+            {"title": "The Zodiac case", "description": ""},
+            {"title": "Prize winners", "description": ""},
+            {"title": "Morning routines", "description": ""},
+        ]
+    }
+    assert [e["title"] for e in filter_by_topic(podcast_data, "cold cases")] == ["The Zodiac case"]
+    assert [e["title"] for e in filter_by_topic(podcast_data, "prizes")] == ["Prize winners"]
+    assert [e["title"] for e in filter_by_topic(podcast_data, "mornings")] == ["Morning routines"]